@@ -6,8 +6,17 @@ Setup script for package installation
 
 from setuptools import setup, find_packages
 import os
+import platform
 import re
 
+# Pure-Python modules with hot tree-walking loops that can be compiled with
+# Cython. The .py sources stay in the package, so imports fall back to them
+# wherever no compiled extension is present.
+CYTHON_MODULES = [
+    "svgg/listers/svg_lister.py",
+    "svgg/validators/svg_validator.py",
+]
+
 # Read version from version.py
 def get_version():
     version_file = os.path.join(os.path.dirname(__file__), 'svgg', 'version.py')
@@ -41,6 +50,18 @@ def get_dev_requirements():
             return [line.strip() for line in f if line.strip() and not line.startswith('#')]
     return []
 
+# Compile CYTHON_MODULES when building with SVGG_CYTHON=1 on CPython.
+# pyproject.toml builds with poetry-core, which does not run this script, so
+# `pip install .` always installs pure Python; compile from a source checkout
+# with `SVGG_CYTHON=1 python setup.py build_ext --inplace`.
+def get_ext_modules():
+    if os.environ.get("SVGG_CYTHON") != "1" or platform.python_implementation() != "CPython":
+        return []
+    from Cython.Build import cythonize
+    # Keep Cython's default bounds and wraparound checks: the modules are
+    # untyped Python, so disabling them gains nothing and makes [-1] unsafe
+    return cythonize(CYTHON_MODULES, language_level=3)
+
 setup(
     name="svgg",
     version=get_version(),
@@ -71,6 +92,7 @@ setup(
     },
     python_requires=">=3.8",
     install_requires=get_requirements(),
+    ext_modules=get_ext_modules(),
     extras_require={
         "dev": get_dev_requirements(),
         "server": ["flask>=2.0.0", "fastapi>=0.68.0", "uvicorn>=0.15.0"],
@@ -58,8 +58,9 @@ from .exceptions import (
 
 # API Client
 try:
-    from .server.client import SVGGClient
+    from .server.client import AsyncSVGGClient, SVGGClient
 except ImportError:
+    AsyncSVGGClient = None
     SVGGClient = None
 
 __all__ = [
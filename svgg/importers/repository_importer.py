@@ -6,11 +6,14 @@ supporting both local and remote repositories, with options to filter by
 file type, size, and commit history.
 """
 
+import fnmatch
 import os
 import shutil
+import subprocess
 import tempfile
+import threading
 from pathlib import Path
-from typing import Dict, List, Optional, Union, Any
+from typing import Dict, Iterator, List, Optional, Set, Tuple, Union, Any
 from datetime import datetime
 
 class RepositoryImporter:
@@ -42,9 +45,26 @@ class RepositoryImporter:
             self.temp_dir = tempfile.mkdtemp(prefix='svgg_repo_')
             self.local_path = Path(self.temp_dir) / Path(repo_url).stem
     
-    def clone_repository(self) -> bool:
+    def clone_repository(self, blobless: bool = False, shared: bool = False) -> bool:
         """Clone the remote repository to the local path.
         
+        Repositories given as a filesystem path or ``file://`` URL are cloned
+        with ``--local``, which hardlinks the object store instead of copying
+        it through the Git transport.
+        
+        Args:
+            blobless: If True, make a partial clone without file contents
+                (``--filter=blob:none --no-checkout``). Commits and trees are
+                fetched up front and blobs are downloaded on demand, so
+                get_file_history and list_files work without fetching file
+                contents (list_files reports a size of None for blobs not yet
+                downloaded). Falls back to a full clone if the server does not
+                support partial clones.
+                Ignored for local repositories.
+            shared: For local repositories, also pass ``--shared`` so the
+                clone borrows objects from the source via alternates. The
+                source repository must outlive the clone.
+        
         Returns:
             bool: True if cloning was successful, False otherwise
             
@@ -62,6 +82,30 @@ class RepositoryImporter:
                 "GitPython is required for repository operations. "
                 "Install it with: pip install gitpython"
             )
+        
+        source = self.repo_url
+        if source.startswith('file://'):
+            source = source[len('file://'):]
+        if os.path.isdir(source):
+            try:
+                multi_options = ['--local', '--shared'] if shared else ['--local']
+                self.repo = Repo.clone_from(source, self.local_path, multi_options=multi_options)
+                return True
+            except Exception as e:
+                print(f"Error cloning repository: {e}")
+                return False
+        
+        if blobless:
+            try:
+                self.repo = Repo.clone_from(
+                    self.repo_url,
+                    self.local_path,
+                    multi_options=['--filter=blob:none', '--no-checkout'],
+                )
+                return True
+            except Exception as e:
+                print(f"Partial clone failed, falling back to full clone: {e}")
+                shutil.rmtree(self.local_path, ignore_errors=True)
             
         try:
             self.repo = Repo.clone_from(self.repo_url, self.local_path)
@@ -137,7 +181,9 @@ class RepositoryImporter:
             recursive: Whether to list files recursively
             
         Returns:
-            List of dictionaries containing file information
+            List of dictionaries containing file information. In a partial
+            clone, 'size' is None for blobs that have not been downloaded,
+            since reading it would fetch each blob from the remote.
             
         Raises:
             RuntimeError: If no repository is loaded
@@ -147,13 +193,14 @@ class RepositoryImporter:
             
         files = []
         try:
+            missing = self._missing_blobs(ref)
             tree = self.repo.commit(ref).tree
             for item in tree.traverse():
                 if item.type == 'blob':  # Regular file
                     files.append({
                         'path': item.path,
                         'name': os.path.basename(item.path),
-                        'size': item.size,
+                        'size': None if item.hexsha in missing else item.size,
                         'type': 'file',
                         'mode': item.mode,
                         'hexsha': item.hexsha
@@ -171,6 +218,29 @@ class RepositoryImporter:
             
         return files
     
+    def _missing_blobs(self, ref: str) -> Set[str]:
+        """Object names of blobs under ref that a partial clone has not downloaded.
+        
+        Listing with ``--missing=print`` never triggers a fetch. Ordinary
+        clones have no promisor remote and return an empty set without
+        running the listing.
+        
+        Args:
+            ref: Git reference (branch, tag, or commit hash)
+            
+        Returns:
+            Set of hexshas of blobs missing from the local object store
+        """
+        from git.exc import GitCommandError
+        
+        try:
+            self.repo.git.config('--get-regexp', r'^remote\..*\.promisor$')
+        except GitCommandError:
+            return set()  # no promisor remote, so nothing can be missing
+        
+        output = self.repo.git.rev_list('--objects', '--missing=print', '--no-walk', ref)
+        return {line[1:] for line in output.splitlines() if line.startswith('?')}
+    
     def get_file_content(self, file_path: Union[str, Path], ref: str = 'HEAD') -> Optional[bytes]:
         """Get the content of a file at a specific reference.
         
@@ -189,9 +259,11 @@ class RepositoryImporter:
             
         try:
             commit = self.repo.commit(ref)
-            blob = next((b for b in commit.tree.traverse() if b.path == str(file_path) and b.type == 'blob'), None)
-            if blob:
+            blob = commit.tree / Path(file_path).as_posix()
+            if blob.type == 'blob':
                 return blob.data_stream.read()
+        except KeyError:
+            pass
         except Exception as e:
             print(f"Error getting file content: {e}")
             
@@ -221,21 +293,24 @@ class RepositoryImporter:
         exported = []
         
         try:
-            files = self.list_files(ref=ref)
-            for file_info in files:
+            # Group destinations by blob so each object is read once
+            destinations: Dict[str, List[Path]] = {}
+            for file_info in self.list_files(ref=ref):
                 if file_info['type'] != 'file':
                     continue
                     
                 # Check if file matches any of the patterns
                 if file_patterns:
-                    import fnmatch
                     if not any(fnmatch.fnmatch(file_info['path'], pattern) for pattern in file_patterns):
                         continue
                 
-                # Get file content and write to output directory
-                content = self.get_file_content(file_info['path'], ref=ref)
-                if content is not None:
-                    dest_path = output_dir / file_info['path']
+                destinations.setdefault(file_info['hexsha'], []).append(output_dir / file_info['path'])
+            
+            # Stream all blobs through a single git cat-file process
+            for hexsha, content in self._read_blobs(list(destinations)):
+                if content is None:
+                    continue
+                for dest_path in destinations[hexsha]:
                     dest_path.parent.mkdir(parents=True, exist_ok=True)
                     with open(dest_path, 'wb') as f:
                         f.write(content)
@@ -246,6 +321,54 @@ class RepositoryImporter:
             
         return exported
     
+    def _read_blobs(self, hexshas: List[str]) -> Iterator[Tuple[str, Optional[bytes]]]:
+        """Read many blobs with one pipelined ``git cat-file --batch`` process.
+        
+        All object names are written to the process up front from a helper
+        thread, so Git never waits on a round-trip between objects.
+        
+        Args:
+            hexshas: Object names of the blobs to read
+            
+        Yields:
+            Tuples of (hexsha, content); content is None for missing objects
+        """
+        if not hexshas:
+            return
+            
+        process = subprocess.Popen(
+            ['git', '--git-dir', str(self.repo.git_dir), 'cat-file', '--batch'],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+        
+        def feed() -> None:
+            try:
+                for hexsha in hexshas:
+                    process.stdin.write(hexsha.encode('ascii') + b'\n')
+                process.stdin.close()
+            except (BrokenPipeError, OSError):
+                pass
+        
+        writer = threading.Thread(target=feed, daemon=True)
+        writer.start()
+        try:
+            for hexsha in hexshas:
+                header = process.stdout.readline().split()
+                if not header:
+                    break
+                if len(header) == 3:
+                    content = process.stdout.read(int(header[2]))
+                    process.stdout.read(1)  # trailing newline
+                    yield hexsha, content
+                else:
+                    yield hexsha, None
+        finally:
+            process.stdout.close()
+            writer.join()
+            process.wait()
+    
     def cleanup(self) -> None:
         """Clean up any temporary directories created by this importer."""
         if self.temp_dir and os.path.exists(self.temp_dir):
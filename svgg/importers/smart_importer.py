@@ -6,10 +6,14 @@ It can automatically detect file types, apply filters, and handle different
 import strategies based on file content or metadata.
 """
 
+import json
+import mmap
 import os
-import mimetypes
+import re
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Union, Any, Callable, Set, Type, Tuple
+from typing import Deque, Dict, Iterator, List, Optional, Union, Any, Callable, Set, Type, Tuple
 from dataclasses import dataclass, field
 import hashlib
 
@@ -19,11 +23,26 @@ from .multi_importer import MultiImporter
 from .project_importer import ProjectImporter
 from .repository_importer import RepositoryImporter
 from .zip_importer import ZipImporter
+from ..utils.file_utils import FileUtils
+
+try:
+    import orjson  # type: ignore
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # Type aliases
 FileFilter = Callable[[Dict[str, Any]], bool]
 FileProcessor = Callable[[Union[str, Path]], Dict[str, Any]]
 
+# orjson decodes integers outside the 64-bit range as floats; any such integer
+# has a run of at least 20 digits, so files containing one use the stdlib
+_LONG_DIGITS = re.compile(rb'\d{20}')
+
+# Upper bound on files queued for import at once, keeps memory flat on huge trees
+MAX_PENDING_IMPORTS = 1024
+
+
 @dataclass
 class ImportResult:
     """Result of an import operation."""
@@ -50,6 +69,9 @@ class SmartImporter:
     def __init__(self):
         """Initialize the SmartImporter with default settings."""
         self.file_processors: Dict[str, FileProcessor] = {}
+        self._dispatch: Dict[str, FileProcessor] = {}
+        self._wild: Dict[str, FileProcessor] = {}
+        self._importer_can_import: List[Tuple[Callable[[str], bool], FileProcessor]] = []
         self.filters: List[FileFilter] = []
         self.importers = {
             'svg': SVGImporter(),
@@ -80,6 +102,25 @@ class SmartImporter:
             processor: A callable that processes files of this type
         """
         self.file_processors[mime_type] = processor
+        self._rebuild_dispatcher()
+    
+    def _rebuild_dispatcher(self) -> None:
+        """Precompute the lookup tables used by _get_processor.
+        
+        Exact MIME matches, ``type/*`` wildcards and the ``can_import`` hooks of
+        the wrapped importers are resolved once here instead of on every file.
+        """
+        self._dispatch = dict(self.file_processors)
+        self._wild = {
+            mime_type[:-2]: processor
+            for mime_type, processor in self.file_processors.items()
+            if mime_type.endswith('/*')
+        }
+        self._importer_can_import = [
+            (importer.can_import, importer.import_file)
+            for importer in self.importers.values()
+            if hasattr(importer, 'can_import')
+        ]
     
     def add_filter(self, filter_func: FileFilter) -> None:
         """Add a filter function to apply during import.
@@ -104,24 +145,24 @@ class SmartImporter:
             ImportResult containing information about the import operation
         """
         file_path = Path(file_path)
-        if not file_path.exists():
+        try:
+            stat = file_path.stat()
+        except OSError:
             return ImportResult(
                 success=False,
                 errors=[{'file': str(file_path), 'error': 'File does not exist'}]
             )
         
         # Get file metadata
-        mime_type, _ = mimetypes.guess_type(file_path)
-        if mime_type is None:
-            mime_type = 'application/octet-stream'
+        mime_type = FileUtils.get_mime_type(file_path)
         
         file_info = {
             'path': str(file_path),
             'name': file_path.name,
-            'size': file_path.stat().st_size,
+            'size': stat.st_size,
             'mime_type': mime_type,
             'extension': file_path.suffix.lower(),
-            'modified': file_path.stat().st_mtime,
+            'modified': stat.st_mtime,
             'metadata': {}
         }
         
@@ -157,12 +198,17 @@ class SmartImporter:
     def import_directory(self, 
                        dir_path: Union[str, Path], 
                        recursive: bool = True, 
+                       workers: int = 8,
                        **kwargs) -> ImportResult:
         """Import all files in a directory.
         
+        Files are imported concurrently on a thread pool; results are merged
+        in directory-walk order.
+        
         Args:
             dir_path: Path to the directory to import
             recursive: Whether to include subdirectories
+            workers: Number of worker threads used to import files
             **kwargs: Additional arguments for the processor
             
         Returns:
@@ -175,17 +221,48 @@ class SmartImporter:
                 errors=[{'path': str(dir_path), 'error': 'Not a directory'}]
             )
         
-        result = ImportResult()
+        result = ImportResult(success=True)
+        pending: Deque[Future] = deque()
         
-        # Walk the directory
-        for entry in dir_path.rglob('*') if recursive else dir_path.glob('*'):
-            if entry.is_file():
-                file_result = self.import_file(entry, **kwargs)
-                self._merge_results(result, file_result)
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            for entry in self._iter_files(dir_path, recursive, result.errors):
+                pending.append(pool.submit(self.import_file, entry, **kwargs))
+                if len(pending) >= MAX_PENDING_IMPORTS:
+                    self._merge_results(result, pending.popleft().result())
+            while pending:
+                self._merge_results(result, pending.popleft().result())
         
         result.success = len(result.errors) == 0
         return result
     
+    def _iter_files(self, dir_path: Path, recursive: bool,
+                    errors: List[Dict[str, Any]]) -> Iterator[Path]:
+        """Yield the files in a directory using os.scandir.
+        
+        Directories that cannot be read are skipped and reported in errors,
+        so the rest of the walk still completes.
+        
+        Args:
+            dir_path: Directory to walk
+            recursive: Whether to descend into subdirectories
+            errors: List that unreadable directories are appended to
+            
+        Yields:
+            Paths of regular files
+        """
+        stack = [str(dir_path)]
+        while stack:
+            directory = stack.pop()
+            try:
+                with os.scandir(directory) as it:
+                    for entry in it:
+                        if entry.is_file():
+                            yield Path(entry.path)
+                        elif recursive and entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+            except OSError as e:
+                errors.append({'path': directory, 'error': str(e)})
+    
     def _get_processor(self, mime_type: str) -> FileProcessor:
         """Get the appropriate processor for a MIME type.
         
@@ -198,22 +275,26 @@ class SmartImporter:
         Raises:
             ValueError: If no processor is found for the MIME type
         """
-        # Try exact match first
-        if mime_type in self.file_processors:
-            return self.file_processors[mime_type]
-        
-        # Try type/* pattern
-        main_type = mime_type.split('/')[0] + '/*'
-        if main_type in self.file_processors:
-            return self.file_processors[main_type]
-        
-        # Try to find a compatible importer
-        for importer in self.importers.values():
-            if hasattr(importer, 'can_import') and importer.can_import(mime_type):
-                return importer.import_file
+        return (
+            self._dispatch.get(mime_type)
+            or self._wild.get(mime_type.split('/', 1)[0])
+            or self._first_matching_importer(mime_type)
+            or self._process_binary
+        )
+    
+    def _first_matching_importer(self, mime_type: str) -> Optional[FileProcessor]:
+        """Return the import function of the first importer accepting a MIME type.
         
-        # Default to binary processor
-        return self._process_binary
+        Args:
+            mime_type: The MIME type to look up
+            
+        Returns:
+            The importer's import function, or None if no importer matches
+        """
+        for can_import, import_file in self._importer_can_import:
+            if can_import(mime_type):
+                return import_file
+        return None
     
     def _passes_filters(self, file_info: Dict[str, Any]) -> bool:
         """Check if a file passes all registered filters.
@@ -263,10 +344,25 @@ class SmartImporter:
         return {'type': 'text', 'content': content, 'length': len(content)}
     
     def _process_json(self, file_path: Union[str, Path], **kwargs) -> Dict[str, Any]:
-        """Process a JSON file."""
-        import json
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        """Process a JSON file.
+        
+        orjson is used when available. Files it would parse differently from
+        the stdlib (NaN/Infinity constants, integers beyond 64 bits) are
+        parsed with the stdlib json module instead, so results are the same.
+        """
+        with open(file_path, 'rb') as f:
+            if ORJSON_AVAILABLE and os.fstat(f.fileno()).st_size:
+                # Parse the mapped UTF-8 bytes directly, without a str copy
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    if _LONG_DIGITS.search(mm) is None:
+                        try:
+                            with memoryview(mm) as view:
+                                return {'type': 'json', 'data': orjson.loads(view)}
+                        except orjson.JSONDecodeError:
+                            pass  # possibly NaN/Infinity, which the stdlib accepts
+                    data = json.loads(mm[:])
+            else:
+                data = json.load(f)
         return {'type': 'json', 'data': data}
     
     def _process_binary(self, file_path: Union[str, Path], **kwargs) -> Dict[str, Any]:
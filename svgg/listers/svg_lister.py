@@ -5,11 +5,97 @@ This module provides functionality to list and inspect SVG contents,
 including embedded files, metadata, and structural elements.
 """
 
-from typing import Dict, List, Optional, Union
-from xml.etree import ElementTree as ET
+import copy
+import hashlib
+import io
+import threading
+from collections import Counter, OrderedDict
+from functools import cached_property
+from operator import itemgetter
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+from xml.etree import ElementTree as StdET
 
 from ..exceptions import SVGGError
 
+# Prefer libxml2-backed lxml; fall back to the standard library parser
+try:
+    from lxml import etree as ET  # type: ignore
+    from lxml.etree import _Element as Element  # type: ignore
+    LXML_AVAILABLE = True
+    _ELEMENT_TYPES: tuple = (Element, StdET.Element)
+except ImportError:
+    from xml.etree import ElementTree as ET  # type: ignore
+    from xml.etree.ElementTree import Element  # type: ignore
+    LXML_AVAILABLE = False
+    _ELEMENT_TYPES = (Element,)
+
+SVG_NS = 'http://www.w3.org/2000/svg'
+
+
+def _make_parser(encoding: Optional[str] = None):
+    """Create the XML parser used for SVG input.
+    
+    Args:
+        encoding: Encoding that overrides the document's XML declaration;
+            used for bytes encoded from already-decoded text
+    """
+    if not LXML_AVAILABLE:
+        # Keep comments in the tree so embedded-file comments can be found
+        return ET.XMLParser(target=ET.TreeBuilder(insert_comments=True), encoding=encoding)
+    return ET.XMLParser(
+        huge_tree=True,
+        remove_blank_text=True,
+        collect_ids=False,
+        resolve_entities=False,
+        encoding=encoding,
+    )
+
+
+# Pristine parsed trees of recently seen documents, keyed by content digest.
+# They are never handed out; callers get their own copy.
+PARSE_CACHE_SIZE = 32
+PARSE_CACHE_MAX_BYTES = 1024 * 1024
+_parse_cache: 'OrderedDict[Tuple[Optional[str], bytes], Element]' = OrderedDict()
+_parse_cache_lock = threading.Lock()
+
+
+def _parse_bytes(content: bytes, encoding: Optional[str] = None) -> Element:
+    """Parse SVG bytes, copying the tree of an identical recent document.
+    
+    Copying a cached tree is cheaper than parsing it again, and each caller
+    gets a tree of its own that it is free to modify.
+    
+    Args:
+        content: Serialized SVG
+        encoding: Encoding that overrides the document's XML declaration
+    """
+    if len(content) > PARSE_CACHE_MAX_BYTES:
+        return ET.fromstring(content, parser=_make_parser(encoding))
+    
+    # The same bytes parse differently under an encoding override
+    key = (encoding, hashlib.blake2b(content, digest_size=16).digest())
+    with _parse_cache_lock:
+        root = _parse_cache.get(key)
+        if root is not None:
+            _parse_cache.move_to_end(key)
+    if root is not None:
+        return copy.deepcopy(root)
+    
+    root = ET.fromstring(content, parser=_make_parser(encoding))
+    pristine = copy.deepcopy(root)
+    with _parse_cache_lock:
+        _parse_cache[key] = pristine
+        if len(_parse_cache) > PARSE_CACHE_SIZE:
+            _parse_cache.popitem(last=False)
+    return root
+
+
+def _decoded_size(data: str) -> int:
+    """Size in bytes of base64 data once decoded, without decoding it."""
+    padding = 2 if data.endswith('==') else 1 if data.endswith('=') else 0
+    return (len(data) - padding) * 3 // 4
+
 class SVGLister:
     """A class to list and inspect SVG contents.
     
@@ -17,18 +103,60 @@ class SVGLister:
     - List embedded files in an SVG
     - Inspect SVG structure and metadata
     - Generate reports about SVG contents
+    
+    Metadata, embedded files and the report are computed once per instance,
+    so call them after any changes to root. Identical byte content parsed
+    within the process is copied from a cached tree instead of re-parsed.
     """
     
-    def __init__(self, svg_content: Union[str, bytes, ET.Element]) -> None:
+    # Compiled once; only usable on lxml trees
+    if LXML_AVAILABLE:
+        _XP_EMBED = ET.XPath(".//*[@data-filename]")
+        _XP_META = ET.XPath("svg:metadata", namespaces={'svg': SVG_NS})
+        _XP_TYPE = ET.XPath(".//*[local-name()=$t]")
+    
+    def __init__(self, svg_content: Union[str, bytes, Element]) -> None:
         """Initialize the SVGLister with SVG content.
         
         Args:
             svg_content: SVG content as string, bytes, or ElementTree Element
         """
         self.svg_content = svg_content
-        self.root = self._parse_svg()
+        self._set_root(self._parse_svg())
+    
+    @classmethod
+    def from_path(cls, path: Union[str, Path]) -> 'SVGLister':
+        """Create an SVGLister by parsing an SVG file directly.
+        
+        The parser reads the file itself, so no intermediate copy of the
+        content is held in Python.
+        
+        Args:
+            path: Path to the SVG file
+            
+        Returns:
+            SVGLister for the parsed file
+            
+        Raises:
+            SVGGError: If the file cannot be parsed
+        """
+        try:
+            tree = ET.parse(str(path), parser=_make_parser())
+        except ET.ParseError as e:
+            raise SVGGError(f"Failed to parse SVG content: {str(e)}")
+        
+        lister = cls.__new__(cls)
+        lister.svg_content = Path(path)
+        lister._set_root(tree.getroot())
+        return lister
+    
+    def _set_root(self, root: Element) -> None:
+        """Bind the parsed root element and the tree-flavour specific helpers."""
+        self.root = root
+        self._is_lxml_tree = LXML_AVAILABLE and isinstance(root, Element)
+        self._comment_tag = ET.Comment if self._is_lxml_tree else StdET.Comment
     
-    def _parse_svg(self) -> ET.Element:
+    def _parse_svg(self) -> Element:
         """Parse the SVG content into an ElementTree Element.
         
         Returns:
@@ -39,8 +167,15 @@ class SVGLister:
         """
         try:
             if isinstance(self.svg_content, (str, bytes)):
-                return ET.fromstring(self.svg_content)
-            elif isinstance(self.svg_content, ET.Element):
+                content = self.svg_content
+                if LXML_AVAILABLE and isinstance(content, str):
+                    # lxml rejects str input carrying an encoding declaration;
+                    # the text is already decoded, so override the declaration
+                    return _parse_bytes(content.encode('utf-8'), encoding='utf-8')
+                if isinstance(content, bytes):
+                    return _parse_bytes(content)
+                return ET.fromstring(content, parser=_make_parser())
+            elif isinstance(self.svg_content, _ELEMENT_TYPES):
                 return self.svg_content
             else:
                 raise SVGGError("Unsupported SVG content type. Expected str, bytes, or Element.")
@@ -54,51 +189,75 @@ class SVGLister:
             List of dictionaries containing information about embedded files.
             Each dictionary has string keys and values that can be strings or integers.
         """
+        return [dict(file_info) for file_info in self._embedded_files]
+    
+    @cached_property
+    def _embedded_files(self) -> List[Dict[str, object]]:
+        """Embedded files found in the tree, computed on first use."""
         embedded_files = []
         
         # Check for files embedded in custom metadata elements
-        for elem in self.root.findall(".//*[@data-filename]"):
-            if 'data-content' in elem.attrib:
-                filename = elem.get('data-filename', 'unnamed.bin')
-                content_type = elem.get('data-type', 'application/octet-stream')
-                size = len(elem.get('data-content', '')) * 3 // 4  # Approximate size
-                
-                embedded_files.append({
-                    'filename': filename,
-                    'type': content_type,
-                    'size_bytes': size,
-                    'location': 'metadata',
-                    'element': elem.tag
-                })
+        if self._is_lxml_tree:
+            candidates = self._XP_EMBED(self.root)
+        else:
+            candidates = self.root.findall(".//*[@data-filename]")
+        for elem in candidates:
+            file_info = self._embedded_from_element(elem)
+            if file_info is not None:
+                embedded_files.append(file_info)
         
         # Check for files embedded in comments (common pattern)
-        for i, comment in enumerate(self._find_comments(self.root)):
-            text = comment.text.strip() if comment.text else ''
-            if text.startswith('FILE:'):
-                try:
-                    parts = text.split('\n', 1)
-                    if len(parts) == 2:
-                        filename = parts[0][5:].strip()
-                        size = len(parts[1].strip()) * 3 // 4  # Approximate size
-                        
-                        embedded_files.append({
-                            'filename': filename,
-                            'type': 'application/octet-stream',
-                            'size_bytes': size,
-                            'location': f'comment_{i}',
-                            'element': 'comment'
-                        })
-                except Exception as e:
-                    print(f"Warning: Failed to parse embedded file from comment: {str(e)}")
+        for i, comment in enumerate(self.root.iter(self._comment_tag)):
+            file_info = self._embedded_from_comment(comment, i)
+            if file_info is not None:
+                embedded_files.append(file_info)
         
         return embedded_files
     
+    def _embedded_from_element(self, elem: Element) -> Optional[Dict[str, object]]:
+        """Describe a file embedded in a ``data-filename`` element, if any."""
+        attrib = elem.attrib
+        content = attrib.get('data-content')
+        if content is None:
+            return None
+        return {
+            'filename': attrib.get('data-filename', 'unnamed.bin'),
+            'type': attrib.get('data-type', 'application/octet-stream'),
+            'size_bytes': _decoded_size(content),
+            'location': 'metadata',
+            'element': elem.tag
+        }
+    
+    def _embedded_from_comment(self, comment: Element, index: int) -> Optional[Dict[str, object]]:
+        """Describe a file embedded in a ``FILE:`` comment, if any."""
+        text = comment.text.strip() if comment.text else ''
+        if not text.startswith('FILE:'):
+            return None
+        try:
+            parts = text.split('\n', 1)
+            if len(parts) == 2:
+                return {
+                    'filename': parts[0][5:].strip(),
+                    'type': 'application/octet-stream',
+                    'size_bytes': _decoded_size(parts[1].strip()),
+                    'location': f'comment_{index}',
+                    'element': 'comment'
+                }
+        except Exception as e:
+            print(f"Warning: Failed to parse embedded file from comment: {str(e)}")
+        return None
+    
     def get_metadata(self) -> Dict[str, str]:
         """Extract metadata from the SVG.
         
         Returns:
             Dictionary containing SVG metadata
         """
+        return dict(self._metadata)
+    
+    @cached_property
+    def _metadata(self) -> Dict[str, str]:
+        """SVG metadata, computed on first use."""
         metadata = {}
         
         # Basic SVG metadata
@@ -107,11 +266,16 @@ class SVGLister:
         metadata['viewBox'] = self.root.get('viewBox', '')
         
         # Check for metadata elements
-        metadata_elem = self.root.find('{http://www.w3.org/2000/svg}metadata')
+        if self._is_lxml_tree:
+            found = self._XP_META(self.root)
+            metadata_elem = found[0] if found else None
+        else:
+            metadata_elem = self.root.find(f'{{{SVG_NS}}}metadata')
         if metadata_elem is not None:
             for child in metadata_elem:
-                if child.text and child.text.strip():
-                    metadata[child.tag.split('}')[-1]] = child.text.strip()
+                if isinstance(child.tag, str) and child.text and child.text.strip():
+                    tag = child.tag
+                    metadata[tag[tag.rfind('}') + 1:]] = child.text.strip()
         
         return metadata
     
@@ -124,53 +288,46 @@ class SVGLister:
         Returns:
             List of dictionaries containing element information
         """
-        elements = []
+        return [
+            {'tag': tag, 'id': elem_id, 'class': elem_class}
+            for tag, elem_id, elem_class in self.iter_elements(element_type)
+        ]
+    
+    def iter_elements(self, element_type: Optional[str] = None) -> Iterator[Tuple[str, str, str]]:
+        """Iterate over elements in the SVG, optionally filtered by type.
         
-        # If no specific type is provided, find all elements
+        Args:
+            element_type: Optional element type to filter by (e.g., 'rect', 'circle')
+            
+        Yields:
+            Tuples of (tag, id, class) for each element, tag without namespace
+        """
+        # If no specific type is provided, walk all elements
         if element_type is None:
-            for elem in self.root.iter():
-                elements.append({
-                    'tag': elem.tag.split('}')[-1],
-                    'id': elem.get('id', ''),
-                    'class': elem.get('class', '')
-                })
+            matches = self.root.iter()
+        elif self._is_lxml_tree:
+            matches = self._XP_TYPE(self.root, t=element_type)
         else:
-            # Find elements of the specified type
-            for elem in self.root.findall(f'.//{{*}}{element_type}'):
-                elements.append({
-                    'tag': elem.tag.split('}')[-1],
-                    'id': elem.get('id', ''),
-                    'class': elem.get('class', '')
-                })
+            matches = self.root.findall(f'.//{{*}}{element_type}')
         
-        return elements
+        for elem in matches:
+            tag = elem.tag
+            if not isinstance(tag, str):
+                continue  # comments and processing instructions
+            # Slice off any '{namespace}' prefix; rfind gives -1 when there is none
+            yield tag[tag.rfind('}') + 1:], elem.get('id', ''), elem.get('class', '')
     
-    def _find_comments(self, element: ET.Element) -> List[ET.Element]:
-        """Recursively find all comments in the element tree.
+    def count_elements(self) -> Counter:
+        """Count the elements in the SVG by tag.
         
-        Args:
-            element: Root element to search from
-            
         Returns:
-            List of elements that are comments
+            Counter mapping tag names (without namespace) to occurrences
         """
-        comments: List[ET.Element] = []
-        
-        # Check if this element has a comment as a direct child
-        if element.text and isinstance(element.text, str) and '<!--' in element.text:
-            # This is a simplified approach; for full comment parsing, consider using lxml
-            comment_text = element.text.strip()
-            if comment_text.startswith('<!--') and comment_text.endswith('-->'):
-                # Create a new element to represent the comment
-                comment_elem = ET.Element('comment')
-                comment_elem.text = comment_text[4:-3].strip()
-                comments.append(comment_elem)
-        
-        # Recursively check child elements
-        for child in element:
-            comments.extend(self._find_comments(child))
-        
-        return comments
+        return Counter(
+            tag[tag.rfind('}') + 1:]
+            for tag in (elem.tag for elem in self.root.iter())
+            if isinstance(tag, str)
+        )
     
     def generate_report(self) -> str:
         """Generate a text report about the SVG contents.
@@ -178,39 +335,62 @@ class SVGLister:
         Returns:
             Formatted text report
         """
-        report = []
+        return self._report
+    
+    @cached_property
+    def _report(self) -> str:
+        """Text report about the SVG contents, computed on first use."""
+        # Collect embedded files and element counts in a single tree walk
+        element_files: List[Dict[str, object]] = []
+        comment_files: List[Dict[str, object]] = []
+        element_counts: Counter = Counter()
+        comment_index = 0
+        for elem in self.root.iter():
+            tag = elem.tag
+            if not isinstance(tag, str):
+                if tag is self._comment_tag:
+                    file_info = self._embedded_from_comment(elem, comment_index)
+                    if file_info is not None:
+                        comment_files.append(file_info)
+                    comment_index += 1
+                continue
+            element_counts[tag[tag.rfind('}') + 1:]] += 1
+            if elem is not self.root and 'data-filename' in elem.attrib:
+                file_info = self._embedded_from_element(elem)
+                if file_info is not None:
+                    element_files.append(file_info)
+        embedded_files = element_files + comment_files
+        
+        buf = io.StringIO()
+        w = buf.write
         
         # Basic SVG info
-        metadata = self.get_metadata()
-        report.append("=== SVG Information ===")
-        report.append(f"Dimensions: {metadata.get('width', '?')} x {metadata.get('height', '?')}")
-        report.append(f"ViewBox: {metadata.get('viewBox', 'Not specified')}")
-        
-        # Embedded files
-        embedded_files = self.list_embedded_files()
-        report.append("\n=== Embedded Files ===")
+        metadata = self._metadata
+        w("=== SVG Information ===\nDimensions: ")
+        w(metadata.get('width', '?'))
+        w(" x ")
+        w(metadata.get('height', '?'))
+        w("\nViewBox: ")
+        w(metadata.get('viewBox', 'Not specified'))
+        
+        w("\n\n=== Embedded Files ===")
         if embedded_files:
             for i, file_info in enumerate(embedded_files, 1):
-                size_bytes = int(file_info.get('size_bytes', 0))  # Ensure it's an int
-                size_kb = size_bytes / 1024.0
-                report.append(
-                    f"{i}. {file_info['filename']} ({size_kb:.2f} KB, "
+                size_kb = int(file_info.get('size_bytes', 0)) / 1024.0
+                w(
+                    f"\n{i}. {file_info['filename']} ({size_kb:.2f} KB, "
                     f"{file_info['type']}) in {file_info['location']}"
                 )
         else:
-            report.append("No embedded files found.")
-        
-        # Element counts
-        elements = self.list_elements()
-        element_counts: Dict[str, int] = {}
-        for elem in elements:
-            tag = str(elem.get('tag', 'unknown'))
-            element_counts[tag] = element_counts.get(tag, 0) + 1
+            w("\nNo embedded files found.")
         
-        report.append("\n=== Elements ===")
-        for tag, count in sorted(element_counts.items()):
-            report.append(f"- {tag}: {count}")
+        w("\n\n=== Elements ===")
+        for tag, count in sorted(element_counts.items(), key=itemgetter(0)):
+            w("\n- ")
+            w(tag)
+            w(": ")
+            w(str(count))
         
-        return "\n".join(report)
+        return buf.getvalue()
 
 
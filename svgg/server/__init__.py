@@ -4,6 +4,6 @@ This package contains the server-side components of the SVGG application,
 including the web application, API endpoints, and server utilities.
 """
 
-from .client import SVGGClient
+from .client import AsyncSVGGClient, SVGGClient
 
-__all__ = ['SVGGClient']
+__all__ = ['AsyncSVGGClient', 'SVGGClient']
@@ -4,15 +4,80 @@ This module provides a client class for communicating with the SVGG server.
 It handles authentication, request/response serialization, and error handling.
 """
 
+import asyncio
 import json
 import logging
-from typing import Any, Dict, Optional, Union
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, ClassVar, Dict, Iterable, List, Optional, Union
 
 import requests
 from requests.adapters import HTTPAdapter, Retry
 
 from svgg.utils.logger import get_logger
 
+try:
+    import orjson  # type: ignore
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    from requests_toolbelt.multipart.encoder import MultipartEncoder  # type: ignore
+    TOOLBELT_AVAILABLE = True
+except ImportError:
+    TOOLBELT_AVAILABLE = False
+
+try:
+    import httpx  # type: ignore
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+try:
+    import h2  # type: ignore  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Connection pool sizes for the adapters shared by all clients in the process
+POOL_CONNECTIONS = 32
+POOL_MAXSIZE = 64
+
+
+@lru_cache(maxsize=None)
+def _shared_adapter(max_retries: int, backoff_factor: float) -> HTTPAdapter:
+    """Return the process-wide adapter for a retry configuration.
+    
+    Clients with the same retry settings mount the same adapter, so they share
+    its connection pool and reuse open (TLS) connections.
+    """
+    retry_strategy = Retry(
+        total=max_retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=[408, 429, 500, 502, 503, 504],
+        allowed_methods=["GET", "POST", "PUT", "DELETE"],
+    )
+    return HTTPAdapter(
+        pool_connections=POOL_CONNECTIONS,
+        pool_maxsize=POOL_MAXSIZE,
+        max_retries=retry_strategy,
+    )
+
+
+def _dumps(data: Any) -> bytes:
+    """Serialize a request body to UTF-8 JSON bytes."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data).encode('utf-8')
+
+
+def _loads(content: bytes) -> Any:
+    """Parse a JSON response body from bytes."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(content)
+    return json.loads(content)
+
 
 class SVGGClient:
     """Client for interacting with the SVGG server.
@@ -21,6 +86,8 @@ class SVGGClient:
     handling authentication, request/response serialization, and error handling.
     """
     
+    _default: ClassVar[Optional['SVGGClient']] = None
+    
     def __init__(
         self,
         base_url: str = "http://localhost:5000",
@@ -43,17 +110,12 @@ class SVGGClient:
         self.base_url = base_url.rstrip('/')
         self.api_key = api_key
         self.timeout = timeout
+        self.max_retries = max_retries
         self.logger = logger or get_logger('svgg.client')
         
-        # Configure session with retry strategy
+        # Configure session with a shared, retrying connection pool
         self.session = requests.Session()
-        retry_strategy = Retry(
-            total=max_retries,
-            backoff_factor=backoff_factor,
-            status_forcelist=[408, 429, 500, 502, 503, 504],
-            allowed_methods=["GET", "POST", "PUT", "DELETE"],
-        )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        adapter = _shared_adapter(max_retries, backoff_factor)
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
         
@@ -66,6 +128,17 @@ class SVGGClient:
         if self.api_key:
             self.session.headers['Authorization'] = f'Bearer {self.api_key}'
     
+    @classmethod
+    def default(cls) -> 'SVGGClient':
+        """Return a shared client using the default settings.
+        
+        Returns:
+            The process-wide default SVGGClient instance.
+        """
+        if cls._default is None:
+            cls._default = cls()
+        return cls._default
+    
     def _request(
         self,
         method: str,
@@ -92,29 +165,44 @@ class SVGGClient:
         """
         url = f"{self.base_url}/{endpoint.lstrip('/')}"
         
-        self.logger.debug(
-            "Sending %s request to %s with params=%s, data=%s",
-            method, url, params, data
-        )
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                "Sending %s request to %s with params=%s, data=%s",
+                method, url, params, data
+            )
         
         try:
-            if files:
-                # For file uploads, don't use json=, use data= and files=
+            if files and TOOLBELT_AVAILABLE and not self.max_retries:
+                # Stream the multipart body from the open files. A streamed body
+                # can only be read once, so this is only safe without retries.
+                encoder = MultipartEncoder(fields={**(data or {}), **files})
+                response = self.session.request(
+                    method,
+                    url,
+                    params=params,
+                    data=encoder,
+                    headers={'Content-Type': encoder.content_type},
+                    timeout=self.timeout,
+                )
+            elif files:
+                # Buffer the multipart body so retries resend all of it; drop the
+                # session's JSON content type so requests sets the multipart one
                 response = self.session.request(
                     method,
                     url,
                     params=params,
                     data=data,
                     files=files,
+                    headers={'Content-Type': None},
                     timeout=self.timeout,
                 )
             else:
-                # For JSON data, use json= which handles serialization
+                # Serialize JSON ourselves; the session already sends the JSON content type
                 response = self.session.request(
                     method,
                     url,
                     params=params,
-                    json=data,
+                    data=_dumps(data) if data is not None else None,
                     timeout=self.timeout,
                 )
             
@@ -124,14 +212,14 @@ class SVGGClient:
             if not response.content:
                 return {}
                 
-            return response.json()
+            return _loads(response.content)
             
-        except requests.exceptions.JSONDecodeError as e:
-            self.logger.error("Failed to parse JSON response: %s", str(e))
+        except json.JSONDecodeError as e:
+            self.logger.error("Failed to parse JSON response: %s", e)
             raise ValueError(f"Invalid JSON response: {response.text}") from e
             
         except requests.exceptions.RequestException as e:
-            self.logger.error("Request failed: %s", str(e))
+            self.logger.error("Request failed: %s", e)
             raise
     
     # Example API methods - these should be updated based on actual API endpoints
@@ -203,6 +291,215 @@ class SVGGClient:
         return self._request('GET', '/health')
 
 
+class AsyncSVGGClient:
+    """Asynchronous client for interacting with the SVGG server.
+    
+    This class mirrors SVGGClient on top of httpx.AsyncClient, so many requests
+    can be in flight at once over a shared connection pool (HTTP/2 when the
+    h2 package is installed). Use it as an async context manager or call
+    aclose() when done.
+    """
+    
+    def __init__(
+        self,
+        base_url: str = "http://localhost:5000",
+        api_key: Optional[str] = None,
+        timeout: int = 30,
+        max_connections: int = 64,
+        logger: Optional[logging.Logger] = None,
+    ) -> None:
+        """Initialize the asynchronous SVGG client.
+        
+        Args:
+            base_url: Base URL of the SVGG server.
+            api_key: API key for authentication (if required).
+            timeout: Request timeout in seconds.
+            max_connections: Maximum number of concurrent connections.
+            logger: Logger instance to use. If None, a default logger will be created.
+            
+        Raises:
+            ImportError: If httpx is not installed
+        """
+        if not HTTPX_AVAILABLE:
+            raise ImportError(
+                "httpx is required for the asynchronous client. "
+                "Install it with: pip install httpx"
+            )
+        
+        self.base_url = base_url.rstrip('/')
+        self.api_key = api_key
+        self.timeout = timeout
+        self.logger = logger or get_logger('svgg.client')
+        
+        headers = {'Accept': 'application/json'}
+        if self.api_key:
+            headers['Authorization'] = f'Bearer {self.api_key}'
+        
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            headers=headers,
+            timeout=timeout,
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(max_connections=max_connections),
+        )
+    
+    async def __aenter__(self) -> 'AsyncSVGGClient':
+        """Async context manager entry."""
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Async context manager exit - close the connection pool."""
+        await self.aclose()
+    
+    async def aclose(self) -> None:
+        """Close the underlying connection pool."""
+        await self._client.aclose()
+    
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        files: Optional[Dict] = None,
+    ) -> Dict[str, Any]:
+        """Send an HTTP request to the server.
+        
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE, etc.).
+            endpoint: API endpoint (e.g., '/api/svgs').
+            data: Request body as a dictionary.
+            params: Query parameters.
+            files: Files to upload (for multipart/form-data).
+            
+        Returns:
+            Parsed JSON response as a dictionary.
+            
+        Raises:
+            httpx.HTTPError: If the request fails.
+            ValueError: If the response is not valid JSON.
+        """
+        url = f"/{endpoint.lstrip('/')}"
+        
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                "Sending %s request to %s with params=%s, data=%s",
+                method, url, params, data
+            )
+        
+        try:
+            if files:
+                response = await self._client.request(
+                    method, url, params=params, data=data, files=files
+                )
+            else:
+                response = await self._client.request(
+                    method,
+                    url,
+                    params=params,
+                    content=_dumps(data) if data is not None else None,
+                    headers={'Content-Type': 'application/json'},
+                )
+            
+            response.raise_for_status()
+            
+            # Handle empty responses
+            if not response.content:
+                return {}
+                
+            return _loads(response.content)
+            
+        except json.JSONDecodeError as e:
+            self.logger.error("Failed to parse JSON response: %s", e)
+            raise ValueError(f"Invalid JSON response: {response.text}") from e
+            
+        except httpx.HTTPError as e:
+            self.logger.error("Request failed: %s", e)
+            raise
+    
+    async def get_svg(self, svg_id: str) -> Dict[str, Any]:
+        """Get an SVG by its ID.
+        
+        Args:
+            svg_id: ID of the SVG to retrieve.
+            
+        Returns:
+            SVG data as a dictionary.
+        """
+        return await self._request('GET', f'/api/svgs/{svg_id}')
+    
+    async def create_svg(self, svg_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Create a new SVG.
+        
+        Args:
+            svg_data: SVG data to create.
+            
+        Returns:
+            Created SVG data.
+        """
+        return await self._request('POST', '/api/svgs', data=svg_data)
+    
+    async def update_svg(self, svg_id: str, svg_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Update an existing SVG.
+        
+        Args:
+            svg_id: ID of the SVG to update.
+            svg_data: Updated SVG data.
+            
+        Returns:
+            Updated SVG data.
+        """
+        return await self._request('PUT', f'/api/svgs/{svg_id}', data=svg_data)
+    
+    async def delete_svg(self, svg_id: str) -> None:
+        """Delete an SVG.
+        
+        Args:
+            svg_id: ID of the SVG to delete.
+        """
+        await self._request('DELETE', f'/api/svgs/{svg_id}')
+    
+    async def upload_svg_file(self, file_path: Union[str, Path]) -> Dict[str, Any]:
+        """Upload an SVG file to the server.
+        
+        Args:
+            file_path: Path to the SVG file to upload.
+            
+        Returns:
+            Uploaded SVG data.
+        """
+        path = Path(file_path)
+        # Read off the event loop so other uploads keep progressing
+        loop = asyncio.get_running_loop()
+        content = await loop.run_in_executor(None, path.read_bytes)
+        return await self._request(
+            'POST',
+            '/api/svgs/upload',
+            files={'file': (path.name, content, 'image/svg+xml')}
+        )
+    
+    async def upload_many(self, file_paths: Iterable[Union[str, Path]]) -> List[Dict[str, Any]]:
+        """Upload several SVG files concurrently.
+        
+        Args:
+            file_paths: Paths to the SVG files to upload.
+            
+        Returns:
+            Uploaded SVG data, in the same order as file_paths.
+        """
+        return list(await asyncio.gather(
+            *(self.upload_svg_file(path) for path in file_paths)
+        ))
+    
+    async def health_check(self) -> Dict[str, Any]:
+        """Check the health of the SVGG server.
+        
+        Returns:
+            Health status information.
+        """
+        return await self._request('GET', '/health')
+
+
 # Example usage
 if __name__ == "__main__":
     # Initialize client
@@ -4,11 +4,47 @@ This module provides a FileUtils class with static methods for common file opera
 like reading, writing, and manipulating files and directories.
 """
 
+import fnmatch
 import hashlib
 import mimetypes
+import mmap
+import os
+import re
 import shutil
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Union
+from typing import BinaryIO, List, Union
+
+# Bytes that may appear in text files; anything else marks a file as binary
+_TEXT_CHARS = bytes({7, 8, 9, 10, 12, 13, 27} | set(range(0x20, 0x7F)) | set(range(0x80, 0x100)))
+
+# MIME types of the extensions SVGG handles most, resolved without mimetypes.
+# Entries must match what mimetypes.guess_type returns for the same suffix.
+_FAST_MIME = {
+    '.svg': 'image/svg+xml',
+    '.svgz': 'image/svg+xml',
+    '.png': 'image/png',
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.gif': 'image/gif',
+    '.json': 'application/json',
+    '.xml': 'application/xml',
+    '.html': 'text/html',
+    '.txt': 'text/plain',
+    '.md': 'text/markdown',
+    '.pdf': 'application/pdf',
+    '.zip': 'application/zip',
+}
+
+
+@lru_cache(maxsize=1024)
+def _guess_mime(suffixes: str) -> str:
+    """Resolve a lowercased suffix chain such as '.tar.gz' to a MIME type."""
+    return (
+        _FAST_MIME.get(suffixes)
+        or mimetypes.guess_type('x' + suffixes)[0]
+        or 'application/octet-stream'
+    )
 
 
 class FileUtils:
@@ -24,7 +60,7 @@ class FileUtils:
 
         Args:
             file_path: Path to the file to read.
-            binary: If True, read file in binary mode.
+            binary: If True, read file in binary mode. Text is decoded as UTF-8.
 
         Returns:
             The file contents as a string (text mode) or bytes (binary mode).
@@ -34,14 +70,14 @@ class FileUtils:
             IOError: If there's an error reading the file.
         """
         path = Path(file_path)
-        mode = 'rb' if binary else 'r'
 
         if not path.exists():
             raise FileNotFoundError(f"File not found: {path}")
 
         try:
-            with open(path, mode) as f:
-                return f.read()
+            if binary:
+                return path.read_bytes()
+            return path.read_text(encoding='utf-8')
         except Exception as e:
             raise IOError(f"Error reading file {path}: {str(e)}")
     
@@ -57,7 +93,7 @@ class FileUtils:
         Args:
             file_path: Path to the file to write.
             content: Content to write to the file.
-            binary: If True, write in binary mode.
+            binary: If True, write in binary mode. Text is encoded as UTF-8.
             overwrite: If True, overwrite existing file.
             
         Raises:
@@ -65,15 +101,16 @@ class FileUtils:
             IOError: If there's an error writing the file.
         """
         path = Path(file_path)
-        mode = 'wb' if binary else 'w'
         
         if path.exists() and not overwrite:
             raise FileExistsError(f"File already exists: {path}")
             
         try:
             path.parent.mkdir(parents=True, exist_ok=True)
-            with open(path, mode) as f:
-                f.write(content)
+            if binary:
+                path.write_bytes(content)
+            else:
+                path.write_text(content, encoding='utf-8')
         except Exception as e:
             raise IOError(f"Error writing to file {path}: {str(e)}")
     
@@ -100,12 +137,16 @@ class FileUtils:
         if algorithm not in hashlib.algorithms_available:
             raise ValueError(f"Unsupported hash algorithm: {algorithm}")
             
-        hash_obj = hashlib.new(algorithm)
         with open(path, 'rb') as f:
-            for chunk in iter(lambda: f.read(4096), b''):
-                hash_obj.update(chunk)
-                
-        return hash_obj.hexdigest()
+            if hasattr(hashlib, 'file_digest'):
+                # Python 3.11+: buffered C loop that releases the GIL
+                return hashlib.file_digest(f, algorithm).hexdigest()
+            
+            hash_obj = hashlib.new(algorithm)
+            if os.fstat(f.fileno()).st_size:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    hash_obj.update(mm)
+            return hash_obj.hexdigest()
     
     @staticmethod
     def get_mime_type(file_path: Union[str, Path]) -> str:
@@ -118,9 +159,7 @@ class FileUtils:
             The MIME type as a string (e.g., 'text/plain', 'image/png').
             Returns 'application/octet-stream' if type cannot be determined.
         """
-        path = Path(file_path)
-        mime_type, _ = mimetypes.guess_type(path)
-        return mime_type or 'application/octet-stream'
+        return _guess_mime(''.join(Path(file_path).suffixes).lower())
     
     @staticmethod
     def ensure_directory(directory: Union[str, Path]) -> Path:
@@ -153,9 +192,25 @@ class FileUtils:
             List of Path objects for matching files.
         """
         path = Path(directory)
-        if recursive:
-            return list(path.rglob(pattern))
-        return list(path.glob(pattern))
+        if '/' in pattern or os.sep in pattern or '**' in pattern:
+            # Patterns spanning directories need pathlib's glob semantics
+            return list(path.rglob(pattern) if recursive else path.glob(pattern))
+        
+        flags = re.IGNORECASE if os.path.normcase('A') == 'a' else 0
+        match = re.compile(fnmatch.translate(pattern), flags).match
+        if not recursive:
+            try:
+                with os.scandir(path) as it:
+                    return [Path(entry.path) for entry in it if entry.is_file() and match(entry.name)]
+            except (FileNotFoundError, NotADirectoryError, PermissionError):
+                # Like glob and os.walk, treat an unreadable directory as empty
+                return []
+        
+        files: List[Path] = []
+        for root, _, names in os.walk(path):
+            root_path = Path(root)
+            files.extend(root_path / name for name in names if match(name))
+        return files
     
     @staticmethod
     def copy_file(
@@ -190,9 +245,41 @@ class FileUtils:
             raise FileExistsError(f"Destination file exists: {dst}")
             
         dst.parent.mkdir(parents=True, exist_ok=True)
-        shutil.copy2(src, dst)
+        with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+            FileUtils._copy_contents(fsrc, fdst)
+        shutil.copystat(src, dst)
         return dst
     
+    @staticmethod
+    def _copy_contents(fsrc: BinaryIO, fdst: BinaryIO) -> None:
+        """Copy file contents, in the kernel when copy_file_range is available.
+        
+        Args:
+            fsrc: Source file opened for binary reading.
+            fdst: Destination file opened for binary writing.
+        """
+        size = os.fstat(fsrc.fileno()).st_size if hasattr(os, 'copy_file_range') else 0
+        # A reported size of 0 may hide content (procfs, sysfs, some FUSE
+        # mounts), which copy_file_range would not copy; use userspace then
+        if size > 0:
+            blocksize = max(size, 8 * 1024 * 1024)
+            copied_any = False
+            try:
+                # Copy until EOF rather than st_size bytes, so files that grow
+                # while being copied are not cut short
+                while True:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), blocksize)
+                    if copied == 0:
+                        break
+                    copied_any = True
+                if copied_any:
+                    return
+            except OSError:
+                # Unsupported by the filesystem; file offsets already reflect
+                # what was copied, so finish in userspace
+                pass
+        shutil.copyfileobj(fsrc, fdst, 1024 * 1024)
+    
     @staticmethod
     def move_file(
         source: Union[str, Path],
@@ -270,7 +357,8 @@ class FileUtils:
     def is_binary_file(file_path: Union[str, Path]) -> bool:
         """Check if a file is binary.
         
-        This is a simple check that looks for null bytes in the first 1024 bytes.
+        This is a simple check that looks for control bytes (such as null
+        bytes) that do not occur in text within the first 1024 bytes.
         
         Args:
             file_path: Path to the file.
@@ -287,7 +375,10 @@ class FileUtils:
             
         try:
             with open(path, 'rb') as f:
-                chunk = f.read(1024)
-                return b'\0' in chunk or not chunk.isascii()
+                if hasattr(os, 'pread'):
+                    chunk = os.pread(f.fileno(), 1024, 0)
+                else:
+                    chunk = f.read(1024)
+            return bool(chunk.translate(None, delete=_TEXT_CHARS))
         except Exception:
             return True
@@ -4,10 +4,17 @@ This module provides a centralized logging configuration for the SVGG package.
 It sets up logging with configurable log levels and output formats.
 """
 
+import atexit
 import logging
+import queue
 import sys
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import Optional, Union
+from typing import Dict, Optional, Union
+
+# Background listeners per logger name, kept alive until the logger is reconfigured
+_listeners: Dict[str, QueueListener] = {}
 
 
 def setup_logger(
@@ -19,6 +26,9 @@ def setup_logger(
 ) -> logging.Logger:
     """Configure and return a logger with the specified settings.
 
+    Records are handed to a queue and written to stderr and the log file by a
+    background listener thread, so logging calls never block on I/O.
+
     Args:
         name: Name of the logger. Defaults to 'svgg'.
         log_level: Logging level (e.g., logging.INFO, logging.DEBUG).
@@ -34,11 +44,16 @@ def setup_logger(
     logger.handlers.clear()
     logger.setLevel(log_level)
 
+    previous = _listeners.pop(name, None)
+    if previous is not None:
+        previous.stop()
+        atexit.unregister(previous.stop)
+
     formatter = logging.Formatter(fmt=log_format, datefmt=date_format)
     console_handler = logging.StreamHandler(sys.stderr)
     console_handler.setLevel(log_level)
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+    handlers = [console_handler]
 
     if log_file:
         log_path = Path(log_file)
@@ -46,17 +61,27 @@ def setup_logger(
         file_handler = logging.FileHandler(log_path)
         file_handler.setLevel(log_level)
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        handlers.append(file_handler)
+
+    log_queue: queue.Queue = queue.Queue(-1)
+    logger.addHandler(QueueHandler(log_queue))
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    _listeners[name] = listener
+    atexit.register(listener.stop)
 
     logger.propagate = False
     return logger
 
 
+@lru_cache(maxsize=None)
 def get_logger(name: Optional[str] = None) -> logging.Logger:
     """Get a logger with the specified name.
 
     This is a convenience function that returns a logger with default settings
-    if it hasn't been configured yet.
+    if it hasn't been configured yet. Results are cached per name; loggers are
+    process-wide singletons, so later setup_logger calls still apply to the
+    returned instance.
 
     Args:
         name: Name of the logger. If None, returns the root logger.
@@ -11,12 +11,189 @@ This module provides functionality to validate SVG content against the SVG
 specification and check for common issues and best practices.
 """
 
+import hashlib
+import io
 import re
-from typing import Dict, List, Union
-from xml.etree import ElementTree as ET
+import sys
+import threading
+from collections import OrderedDict
+from itertools import chain
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union
+from xml.etree import ElementTree as StdET
 
 from ..exceptions import SVGGError
 
+# Prefer libxml2-backed lxml; fall back to the standard library parser
+try:
+    from lxml import etree as ET  # type: ignore
+    from lxml.etree import _Element as Element  # type: ignore
+    LXML_AVAILABLE = True
+    _ELEMENT_TYPES: tuple = (Element, StdET.Element)
+except ImportError:
+    from xml.etree import ElementTree as ET  # type: ignore
+    from xml.etree.ElementTree import Element  # type: ignore
+    LXML_AVAILABLE = False
+    _ELEMENT_TYPES = (Element,)
+
+# Harden the standard library parser against entity expansion when defusedxml
+# is installed; the lxml parser is configured with entity resolution disabled
+try:
+    from defusedxml import ElementTree as SafeET  # type: ignore
+    from defusedxml.common import DefusedXmlException  # type: ignore
+    DEFUSEDXML_AVAILABLE = True
+    _PARSE_ERRORS: tuple = (ET.ParseError, DefusedXmlException)
+except ImportError:
+    SafeET = StdET
+    DEFUSEDXML_AVAILABLE = False
+    _PARSE_ERRORS = (ET.ParseError,)
+
+SVG_NS = 'http://www.w3.org/2000/svg'
+_SVG_ROOT_TAG = sys.intern(f'{{{SVG_NS}}}svg')
+
+# A letter or underscore, then letters, digits, hyphens, underscores, colons and periods
+_ID_RE = re.compile(r'[a-zA-Z_][\w\-.:]*\Z')
+
+# ASCII equivalents of _ID_RE for the translate-based fast path
+_ID_START_BYTES = b'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz_'
+_ID_BYTES = _ID_START_BYTES + b'0123456789-.:'
+
+
+def _match_id(value: str) -> bool:
+    """Return whether a value is a valid XML ID, as matched by _ID_RE."""
+    try:
+        data = value.encode('ascii')
+    except UnicodeEncodeError:
+        return _ID_RE.match(value) is not None
+    # Deleting every valid byte leaves nothing behind for a valid ID
+    return bool(data) and data[0] in _ID_START_BYTES and not data.translate(None, _ID_BYTES)
+
+
+# Attribute value rules: attribute -> (check returning True when valid, error code)
+_ATTR_RULES = {
+    'id': (_match_id, 'INVALID_ID'),
+}
+
+# Issue messages by code, formatted only when a message is read
+_MSG_TEMPLATES = {
+    'INVALID_ROOT': 'Root element must be an SVG element',
+    'MISSING_WIDTH': 'SVG is missing recommended attribute: width',
+    'MISSING_HEIGHT': 'SVG is missing recommended attribute: height',
+    'MISSING_VIEWBOX': 'SVG is missing recommended attribute: viewBox',
+    'UNKNOWN_ELEMENT': 'Element <{element}> is not a standard SVG element',
+    'MISSING_ATTR': 'Required attribute "{attribute}" is missing',
+    'INVALID_ID': 'Invalid ID: "{value}" (must start with a letter)',
+}
+
+# Valid SVG elements (simplified list)
+_VALID_ELEMENTS = frozenset({
+    'svg', 'g', 'path', 'rect', 'circle', 'ellipse', 'line', 'polyline',
+    'polygon', 'text', 'tspan', 'image', 'use', 'defs', 'clipPath',
+    'linearGradient', 'radialGradient', 'stop', 'style', 'script'
+})
+
+# Required attributes for common elements
+_REQUIRED_ATTRS = {
+    'image': ('xlink:href', 'x', 'y', 'width', 'height'),
+    'use': ('xlink:href', 'x', 'y'),
+    'linearGradient': ('id', 'x1', 'y1', 'x2', 'y2'),
+    'radialGradient': ('id', 'cx', 'cy', 'r', 'fx', 'fy'),
+    'stop': ('offset', 'stop-color')
+}
+
+# is_valid_svg verdicts for recently seen documents, keyed by content digest
+VALID_CACHE_SIZE = 1024
+VALID_CACHE_MAX_BYTES = 1024 * 1024
+_valid_cache: 'OrderedDict[Tuple[bool, bytes], bool]' = OrderedDict()
+_valid_cache_lock = threading.Lock()
+
+# Report text for a document with no errors or warnings
+_EMPTY_REPORT = (
+    "=== SVG Validation Report ===\n"
+    "\nNo errors found!\n"
+    "\nNo warnings found!\n"
+    "\nSummary: 0 errors, 0 warnings"
+)
+
+def _iterparse(svg_content: Union[str, bytes]) -> Iterator[Tuple[str, Element]]:
+    """Parse serialized SVG incrementally, yielding start and end events."""
+    if not LXML_AVAILABLE:
+        # expat ignores the encoding declaration when fed already-decoded text
+        if isinstance(svg_content, str):
+            return SafeET.iterparse(io.StringIO(svg_content), events=('start', 'end'))
+        return SafeET.iterparse(io.BytesIO(svg_content), events=('start', 'end'))
+    encoding = None
+    if isinstance(svg_content, str):
+        # The text is already decoded, so override any encoding declaration
+        svg_content = svg_content.encode('utf-8')
+        encoding = 'utf-8'
+    return ET.iterparse(
+        io.BytesIO(svg_content), events=('start', 'end'),
+        huge_tree=True, resolve_entities=False, encoding=encoding,
+    )
+
+
+def _iter_start_elements(svg_content: Union[str, bytes]) -> Iterator[Element]:
+    """Yield elements as their start tags are parsed, root first.
+    
+    Each element is cleared and detached from its parent once its end tag is
+    parsed, so only the root, the currently open elements and (under lxml) the
+    most recently finished child of each open element stay in memory. The
+    root keeps its attributes and at most one emptied child.
+    """
+    parents: List[Element] = []
+    for event, element in _iterparse(svg_content):
+        if event == 'start':
+            parents.append(element)
+            yield element
+            continue
+        parents.pop()
+        if not parents:
+            continue  # keep the root for callers
+        element.clear()
+        # Explicit index: the module may be compiled with wraparound disabled
+        parent = parents[len(parents) - 1]
+        if LXML_AVAILABLE:
+            # lxml still tracks the element just ended, so drop its predecessors
+            while element.getprevious() is not None:
+                del parent[0]
+        else:
+            parent.remove(element)
+
+class ValidationIssue(NamedTuple):
+    """A single validation error or warning.
+    
+    Only the code and its context are stored; the message is built from
+    _MSG_TEMPLATES when it is read. Issues used to be dicts, so fields can
+    also be read by key (issue['code'], issue.get('element')).
+    """
+    
+    code: str
+    element: Optional[str] = None
+    attribute: Optional[str] = None
+    value: Optional[str] = None
+    
+    @property
+    def message(self) -> str:
+        """Human-readable description of the issue."""
+        return _MSG_TEMPLATES[self.code].format(**self._asdict())
+    
+    def __getitem__(self, key):
+        """Read a field by name, as with the former dict issues, or by position."""
+        if isinstance(key, str):
+            if key != 'message' and key not in self._fields:
+                raise KeyError(key)
+            return getattr(self, key)
+        return tuple.__getitem__(self, key)
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return a field by name, or default if it is unknown or unset."""
+        try:
+            value = self[key]
+        except KeyError:
+            return default
+        return default if value is None else value
+
 class SVGValidator:
     """Validate SVG content against the SVG specification.
     
@@ -24,34 +201,73 @@ class SVGValidator:
     check for common issues and best practices, and generate validation reports.
     """
     
-    def __init__(self, svg_content: Union[str, bytes, ET.Element]) -> None:
+    def __init__(self, svg_content: Union[str, bytes, Element], stream: bool = False) -> None:
         """Initialize the SVGValidator with SVG content.
         
         Args:
             svg_content: SVG content as string, bytes, or ElementTree Element
+            stream: Parse serialized content incrementally during validation
+                instead of building the whole tree up front. Finished subtrees
+                are dropped, so memory grows with document depth rather than
+                size; root is set once validation has started and keeps at
+                most one emptied child. Ignored when an Element is passed.
         """
         self.svg_content = svg_content
-        self.root = self._parse_svg()
-        self.errors: List[Dict[str, str]] = []
-        self.warnings: List[Dict[str, str]] = []
+        self.stream = stream and isinstance(svg_content, (str, bytes))
+        self.root: Optional[Element] = None if self.stream else self._parse_svg()
+        self.errors: List[ValidationIssue] = []
+        self.warnings: List[ValidationIssue] = []
+        self._last_result: Optional[Dict[str, Union[bool, List[ValidationIssue]]]] = None
+        self._last_content: Optional[Union[str, bytes]] = None
     
-    def _parse_svg(self) -> ET.Element:
+    def reset(self) -> None:
+        """Clear recorded issues and the cached validate() result.
+        
+        The cache is kept only for string or bytes input and only while
+        svg_content is the same object; it does not notice edits made to
+        self.root, so call reset() after modifying the parsed tree.
+        """
+        self.errors = []
+        self.warnings = []
+        self._last_result = None
+        self._last_content = None
+    
+    def _parse_svg(self, stream: bool = False) -> Union[Element, Iterator[Element]]:
         """Parse the SVG content into an ElementTree Element.
         
+        Args:
+            stream: Return an iterator over the elements of serialized content
+                instead of the parsed root
+            
         Returns:
-            The root element of the SVG document
+            The root element of the SVG document, or its elements in document
+            order when streaming
             
         Raises:
             SVGGError: If the SVG content cannot be parsed
         """
         try:
+            if stream and isinstance(self.svg_content, (str, bytes)):
+                return _iter_start_elements(self.svg_content)
             if isinstance(self.svg_content, (str, bytes)):
-                return ET.fromstring(self.svg_content)
-            elif isinstance(self.svg_content, ET.Element):
+                if not LXML_AVAILABLE:
+                    return SafeET.fromstring(self.svg_content)
+                content = self.svg_content
+                encoding = None
+                if isinstance(content, str):
+                    # lxml rejects str input carrying an encoding declaration;
+                    # the text is already decoded, so override the declaration
+                    content = content.encode('utf-8')
+                    encoding = 'utf-8'
+                # huge_tree lifts libxml2's text size and depth limits so large
+                # embedded payloads parse as in the lister; entities stay unresolved
+                parser = ET.XMLParser(huge_tree=True, resolve_entities=False, encoding=encoding)
+                return ET.fromstring(content, parser=parser)
+            elif isinstance(self.svg_content, _ELEMENT_TYPES):
                 return self.svg_content
             else:
                 raise SVGGError("Unsupported SVG content type. Expected str, bytes, or Element.")
-        except ET.ParseError as e:
+        except _PARSE_ERRORS as e:
             raise SVGGError(f"Failed to parse SVG content: {str(e)}")
     
     def validate_structure(self) -> bool:
@@ -60,28 +276,8 @@ class SVGValidator:
         Returns:
             True if the SVG structure is valid, False otherwise
         """
-        is_valid = True
-        
-        # Check root element is SVG
-        if self.root.tag != '{http://www.w3.org/2000/svg}svg':
-            self.errors.append({
-                'code': 'INVALID_ROOT',
-                'message': 'Root element must be an SVG element',
-                'element': self.root.tag
-            })
-            is_valid = False
-        
-        # Check for required attributes
-        required_attrs = ['width', 'height', 'viewBox']
-        for attr in required_attrs:
-            if attr not in self.root.attrib:
-                self.warnings.append({
-                    'code': f'MISSING_{attr.upper()}',
-                    'message': f'SVG is missing recommended attribute: {attr}',
-                    'element': 'svg'
-                })
-        
-        return is_valid
+        self._last_result = None
+        return self._validate_all(elements=False)[0]
     
     def validate_elements(self) -> bool:
         """Validate SVG elements and their attributes.
@@ -89,45 +285,86 @@ class SVGValidator:
         Returns:
             True if all elements are valid, False otherwise
         """
-        is_valid = True
+        self._last_result = None
+        return self._validate_all(structure=False)[1]
+    
+    def _validate_all(self, structure: bool = True, elements: bool = True) -> Tuple[bool, bool]:
+        """Run structure and element validation in a single pass.
         
-        # Define valid SVG elements (simplified list)
-        valid_elements = {
-            'svg', 'g', 'path', 'rect', 'circle', 'ellipse', 'line', 'polyline',
-            'polygon', 'text', 'tspan', 'image', 'use', 'defs', 'clipPath',
-            'linearGradient', 'radialGradient', 'stop', 'style', 'script'
-        }
+        The structure checks only look at the root element, so they run first
+        and the element checks then walk the tree once.
+        
+        Args:
+            structure: Whether to validate the root structure
+            elements: Whether to validate all elements and their attributes
+            
+        Returns:
+            Tuple of (structure is valid, elements are valid)
+        """
+        structure_valid = True
+        elements_valid = True
+        elements_iter = self._iter_elements()
+        root = next(elements_iter)
+        
+        if structure:
+            # Check root element is SVG
+            if root.tag != _SVG_ROOT_TAG:
+                self.errors.append(ValidationIssue('INVALID_ROOT', root.tag))
+                structure_valid = False
+            
+            # Check for recommended attributes
+            for attr in ('width', 'height', 'viewBox'):
+                if attr not in root.attrib:
+                    self.warnings.append(ValidationIssue(f'MISSING_{attr.upper()}', 'svg'))
+        
+        if not elements:
+            return structure_valid, elements_valid
         
         # Check all elements in the document
-        for element in self.root.iter():
-            # Remove namespace for validation
-            tag = element.tag.split('}')[-1] if '}' in element.tag else element.tag
+        for element in chain((root,), elements_iter):
+            tag = element.tag
+            if not isinstance(tag, str):
+                continue  # comments and processing instructions
             
-            # Check if this element has a comment as a direct child
-            if element.text and isinstance(element.text, str) and '<!--' in element.text:
-                # This is a simplified approach; for full comment parsing,
-                # consider using lxml
-                comment_text = element.text.strip()
-                if comment_text.startswith('<!--') and comment_text.endswith('-->'):
-                    # Create a new element to represent the comment
-                    comment_elem = ET.Element('comment')
-                    comment_elem.text = comment_text[4:-3].strip()
-                    element.append(comment_elem)
+            # Remove namespace for validation; rfind gives -1 when there is none
+            tag = tag[tag.rfind('}') + 1:]
             
             # Check if element is a valid SVG element
-            if tag not in valid_elements:
-                self.warnings.append({
-                    'code': 'UNKNOWN_ELEMENT',
-                    'message': f'Element <{tag}> is not a standard SVG element',
-                    'element': tag
-                })
+            if tag not in _VALID_ELEMENTS:
+                self.warnings.append(ValidationIssue('UNKNOWN_ELEMENT', tag))
+            
+            # Nothing to check on an element with no attributes and none required
+            if tag not in _REQUIRED_ATTRS and not element.attrib:
+                continue
             
             # Validate element attributes
-            is_valid = self._validate_attributes(element, tag) and is_valid
+            elements_valid = self._validate_attributes(element, tag) and elements_valid
         
-        return is_valid
+        return structure_valid, elements_valid
     
-    def _validate_attributes(self, elem: ET.Element, tag: str) -> bool:
+    def _iter_elements(self) -> Iterator[Element]:
+        """Yield every element in document order, root first.
+        
+        In streaming mode the document is parsed as it is consumed and each
+        subtree is dropped once it has been yielded.
+        
+        Raises:
+            SVGGError: If the SVG content cannot be parsed
+        """
+        if not self.stream:
+            yield from self.root.iter()
+            return
+        
+        root = None
+        try:
+            for element in self._parse_svg(stream=True):
+                if root is None:
+                    root = self.root = element
+                yield element
+        except _PARSE_ERRORS as e:
+            raise SVGGError(f"Failed to parse SVG content: {str(e)}")
+    
+    def _validate_attributes(self, elem: Element, tag: str) -> bool:
         """Validate attributes for a given element.
         
         Args:
@@ -139,40 +376,23 @@ class SVGValidator:
         """
         is_valid = True
         
-        # Define required attributes for common elements
-        required_attrs = {
-            'image': ['xlink:href', 'x', 'y', 'width', 'height'],
-            'use': ['xlink:href', 'x', 'y'],
-            'linearGradient': ['id', 'x1', 'y1', 'x2', 'y2'],
-            'radialGradient': ['id', 'cx', 'cy', 'r', 'fx', 'fy'],
-            'stop': ['offset', 'stop-color']
-        }
-        
         # Check required attributes
-        for attr in required_attrs.get(tag, []):
+        for attr in _REQUIRED_ATTRS.get(tag, ()):
             if attr not in elem.attrib:
-                self.errors.append({
-                    'code': 'MISSING_ATTR',
-                    'message': f'Required attribute "{attr}" is missing',
-                    'element': tag,
-                    'attribute': attr
-                })
+                self.errors.append(ValidationIssue('MISSING_ATTR', tag, attr))
                 is_valid = False
         
-        # Validate attribute values
-        for attr, value in elem.attrib.items():
-            if attr == 'id' and not self._is_valid_id(value):
-                self.errors.append({
-                    'code': 'INVALID_ID',
-                    'message': f'Invalid ID: "{value}" (must start with a letter)'
-                })
+        # Validate attribute values; add more rules to _ATTR_RULES as needed
+        for attr, (check, code) in _ATTR_RULES.items():
+            value = elem.attrib.get(attr)
+            if value is not None and not check(value):
+                self.errors.append(ValidationIssue(code, value=value))
                 is_valid = False
             
-            # Add more attribute validations as needed
-            
         return is_valid
     
-    def _is_valid_id(self, id_str: str) -> bool:
+    @staticmethod
+    def _is_valid_id(id_str: str) -> bool:
         """Check if an ID is valid according to XML ID rules.
         
         Args:
@@ -181,35 +401,38 @@ class SVGValidator:
         Returns:
             True if the ID is valid, False otherwise
         """
-        if not id_str:
-            return False
-        
-        # Must start with a letter or underscore
-        if not (id_str[0].isalpha() or id_str[0] == '_'):
-            return False
-        
-        # Can contain letters, digits, hyphens, underscores, colons, and periods
-        return bool(re.match(r'^[a-zA-Z_][\w\-.:]*$', id_str))
+        return _match_id(id_str)
     
-    def validate(self) -> Dict[str, Union[bool, List[Dict[str, str]]]]:
+    def validate(self) -> Dict[str, Union[bool, List[ValidationIssue]]]:
         """Run all validation checks on the SVG.
         
+        For string or bytes input the result is cached, so repeated calls
+        (including the one made by get_validation_report) do not re-validate
+        until svg_content is replaced or reset() is called. An Element passed
+        by the caller may be edited between calls, so it is always re-validated.
+        
         Returns:
             Dictionary containing validation results with 'is_valid' flag,
-            'errors' and 'warnings' lists
+            'errors' and 'warnings' lists of ValidationIssue records
         """
-        self.errors = []
-        self.warnings = []
+        content = self.svg_content
+        if self._last_result is not None and self._last_content is content:
+            return self._last_result
+        
+        self.reset()
         
         # Run validation checks
-        self.validate_structure()
-        self.validate_elements()
+        self._validate_all()
         
-        return {
+        result = {
             'is_valid': len(self.errors) == 0,
             'errors': self.errors,
             'warnings': self.warnings
         }
+        if not isinstance(content, _ELEMENT_TYPES):
+            self._last_result = result
+            self._last_content = content
+        return result
     
     def get_validation_report(self) -> str:
         """Generate a human-readable validation report.
@@ -218,39 +441,38 @@ class SVGValidator:
             Formatted validation report as a string
         """
         result = self.validate()
+        errors = result['errors']
+        warnings = result['warnings']
+        if not errors and not warnings:
+            return _EMPTY_REPORT
         
-        report = ["=== SVG Validation Report ==="]
-        
-        # Add errors
-        if result['errors']:
-            report.append("\nErrors:")
-            for i, error in enumerate(result['errors'], 1):
-                report.append(f"{i}. [{error.get('code', 'UNKNOWN')}] {error['message']}")
-                if 'element' in error:
-                    report.append(f"   Element: {error['element']}")
-                if 'attribute' in error:
-                    report.append(f"   Attribute: {error['attribute']}")
-        else:
-            report.append("\nNo errors found!")
-        
-        # Add warnings
-        if result['warnings']:
-            report.append("\nWarnings:")
-            for i, warning in enumerate(result['warnings'], 1):
-                report.append(f"{i}. [{warning.get('code', 'UNKNOWN')}] {warning['message']}")
-                if 'element' in warning:
-                    report.append(f"   Element: {warning['element']}")
-                if 'attribute' in warning:
-                    report.append(f"   Attribute: {warning['attribute']}")
-        else:
-            report.append("\nNo warnings found!")
-        
-        # Add summary
-        error_count = len(result['errors'])
-        warning_count = len(result['warnings'])
-        report.append(f"\nSummary: {error_count} errors, {warning_count} warnings")
+        buf = io.StringIO()
+        write = buf.write
+        write("=== SVG Validation Report ===\n")
+        self._write_issues(write, "Errors", errors)
+        self._write_issues(write, "Warnings", warnings)
+        write(f"\nSummary: {len(errors)} errors, {len(warnings)} warnings")
+        return buf.getvalue()
+    
+    @staticmethod
+    def _write_issues(write: Callable[[str], int], heading: str, issues: List[ValidationIssue]) -> None:
+        """Write one section of the validation report.
         
-        return "\n".join(report)
+        Args:
+            write: Write method of the report buffer
+            heading: Section name, e.g. "Errors"
+            issues: Issues to list in the section
+        """
+        if not issues:
+            write(f"\nNo {heading.lower()} found!\n")
+            return
+        write(f"\n{heading}:\n")
+        for i, issue in enumerate(issues, 1):
+            write(f"{i}. [{issue.code}] {issue.message}\n")
+            if issue.element is not None:
+                write(f"   Element: {issue.element}\n")
+            if issue.attribute is not None:
+                write(f"   Attribute: {issue.attribute}\n")
     
     @staticmethod
     def is_valid_svg(svg_content: Union[str, bytes]) -> bool:
@@ -263,9 +485,132 @@ class SVGValidator:
             True if the content is valid SVG, False otherwise
         """
         try:
-            validator = SVGValidator(svg_content)
-            result = validator.validate()
-            return result['is_valid']
+            if isinstance(svg_content, _ELEMENT_TYPES):
+                return SVGValidator._is_valid_tree(svg_content)
+            return SVGValidator._is_valid_cached(svg_content)
         except Exception:
             return False
-
+    
+    @staticmethod
+    def is_valid_svg_many(svg_contents: Iterable[Union[str, bytes]],
+                          workers: Optional[int] = None,
+                          use_processes: Optional[bool] = None) -> List[bool]:
+        """Check many SVG documents in parallel.
+        
+        Args:
+            svg_contents: SVG documents as strings or bytes
+            workers: Number of workers (defaults to the executor's default)
+            use_processes: Use a process pool instead of threads. Defaults to
+                threads when lxml is available, since libxml2 parses without
+                holding the GIL, and to processes otherwise
+            
+        Returns:
+            List of is_valid_svg results, in input order
+        """
+        if use_processes is None:
+            use_processes = not LXML_AVAILABLE
+        executor = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+        with executor(max_workers=workers) as pool:
+            return list(pool.map(SVGValidator.is_valid_svg, svg_contents, chunksize=64))
+    
+    @staticmethod
+    def _is_valid_cached(svg_content: Union[str, bytes]) -> bool:
+        """Check serialized SVG, reusing the verdict for a recently seen document.
+        
+        Documents larger than VALID_CACHE_MAX_BYTES are always checked afresh.
+        
+        Args:
+            svg_content: SVG content as string or bytes
+            
+        Returns:
+            True if the content is valid SVG, False otherwise
+        """
+        is_text = isinstance(svg_content, str)
+        data = svg_content.encode('utf-8') if is_text else svg_content
+        if len(data) > VALID_CACHE_MAX_BYTES:
+            return SVGValidator._is_valid_stream(svg_content)
+        
+        # Text ignores the encoding declaration, so it must not share a
+        # verdict with the same bytes
+        key = (is_text, hashlib.blake2b(data, digest_size=16).digest())
+        with _valid_cache_lock:
+            verdict = _valid_cache.get(key)
+            if verdict is not None:
+                _valid_cache.move_to_end(key)
+                return verdict
+        
+        try:
+            verdict = SVGValidator._is_valid_stream(svg_content)
+        except _PARSE_ERRORS:
+            verdict = False
+        with _valid_cache_lock:
+            _valid_cache[key] = verdict
+            if len(_valid_cache) > VALID_CACHE_SIZE:
+                _valid_cache.popitem(last=False)
+        return verdict
+    
+    @staticmethod
+    def _is_valid_stream(svg_content: Union[str, bytes]) -> bool:
+        """Check serialized SVG incrementally, stopping at the first error.
+        
+        The document is parsed with iterparse, so a non-SVG root is rejected
+        after the first start tag and nothing past the first error is read.
+        Finished subtrees are dropped, so memory grows with document depth
+        rather than size.
+        
+        Args:
+            svg_content: SVG content as string or bytes
+            
+        Returns:
+            True if validate() would report no errors, False otherwise
+            
+        Raises:
+            ET.ParseError: If the content is not well-formed XML (or is rejected by defusedxml)
+        """
+        is_root = True
+        for element in _iter_start_elements(svg_content):
+            if is_root:
+                if element.tag != _SVG_ROOT_TAG:
+                    return False
+                is_root = False
+            if SVGValidator._has_element_error(element):
+                return False
+        
+        return True
+    
+    @staticmethod
+    def _is_valid_tree(root: Element) -> bool:
+        """Check a parsed tree for validation errors, stopping at the first one.
+        
+        Args:
+            root: Root element of the parsed SVG
+            
+        Returns:
+            True if validate() would report no errors, False otherwise
+        """
+        if root.tag != _SVG_ROOT_TAG:
+            return False
+        return not any(
+            SVGValidator._has_element_error(element)
+            for element in root.iter()
+            if isinstance(element.tag, str)
+        )
+    
+    @staticmethod
+    def _has_element_error(element: Element) -> bool:
+        """Return whether an element fails the required-attribute or value checks.
+        
+        Runs the same error checks as _validate_attributes without recording
+        anything, since only the verdict is needed.
+        """
+        tag = element.tag
+        tag = tag[tag.rfind('}') + 1:]
+        attrib = element.attrib
+        for attr in _REQUIRED_ATTRS.get(tag, ()):
+            if attr not in attrib:
+                return True
+        for attr, (check, _) in _ATTR_RULES.items():
+            value = attrib.get(attr)
+            if value is not None and not check(value):
+                return True
+        return False
@@ -3,3 +3,64 @@
 test_server_api.py
 """
 
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from svgg.server.client import SVGGClient
+
+
+class _FlakyUploadHandler(BaseHTTPRequestHandler):
+    """Answer the first upload with 503 and later ones with the received size."""
+
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length', 0))
+        body = self.rfile.read(length)
+        self.server.uploads.append((length, len(body)))
+        if len(self.server.uploads) == 1:
+            self.send_response(503)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        payload = json.dumps({'received': len(body)}).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def flaky_server():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _FlakyUploadHandler)
+    server.uploads = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_retried_upload_resends_full_body(flaky_server, tmp_path):
+    svg_file = tmp_path / 'icon.svg'
+    svg_file.write_text(
+        '<svg xmlns="http://www.w3.org/2000/svg">' + '<g/>' * 1500 + '</svg>',
+        encoding='utf-8',
+    )
+    host, port = flaky_server.server_address
+    client = SVGGClient(base_url=f'http://{host}:{port}', max_retries=1, backoff_factor=0)
+
+    result = client.upload_svg_file(str(svg_file))
+
+    assert len(flaky_server.uploads) == 2
+    first, retry = flaky_server.uploads
+    assert retry == first
+    assert retry[0] == retry[1] > svg_file.stat().st_size
+    assert result == {'received': retry[1]}
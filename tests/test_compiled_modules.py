@@ -0,0 +1,53 @@
+# Compiled (Cython) module smoke tests
+"""
+test_compiled_modules.py
+"""
+
+import os
+import shutil
+import subprocess
+import sys
+import sysconfig
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+pytest.importorskip("Cython")
+if shutil.which((sysconfig.get_config_var("CC") or "cc").split()[0]) is None:
+    pytest.skip("no C compiler available", allow_module_level=True)
+
+SMOKE_SCRIPT = """
+import sys
+from svgg.listers import svg_lister
+from svgg.validators import svg_validator
+
+for module in (svg_lister, svg_validator):
+    assert not module.__file__.endswith('.py'), module.__file__
+
+nested = '<svg xmlns="http://www.w3.org/2000/svg"><g><g><rect/></g><g/></g></svg>'
+assert svg_validator.SVGValidator.is_valid_svg(nested)
+assert svg_validator.SVGValidator(nested, stream=True).validate()['is_valid']
+assert svg_lister.SVGLister(nested).count_elements()
+"""
+
+
+def test_compiled_modules_run_on_nested_documents(tmp_path):
+    shutil.copy(REPO_ROOT / "setup.py", tmp_path)
+    shutil.copytree(
+        REPO_ROOT / "svgg", tmp_path / "svgg",
+        ignore=shutil.ignore_patterns("__pycache__", "*.so", "*.c"),
+    )
+    env = dict(os.environ, SVGG_CYTHON="1")
+    subprocess.run(
+        [sys.executable, "setup.py", "build_ext", "--inplace"],
+        cwd=tmp_path, env=env, check=True, capture_output=True,
+    )
+
+    # Run in a separate interpreter so a crash in compiled code fails the test
+    result = subprocess.run(
+        [sys.executable, "-c", SMOKE_SCRIPT],
+        cwd=tmp_path, capture_output=True, text=True,
+    )
+    assert result.returncode == 0, result.stderr
@@ -0,0 +1,25 @@
+# SVG validator tests
+"""
+test_svg_validator.py
+"""
+
+from svgg.validators.svg_validator import SVGValidator
+
+SVG_NS = 'http://www.w3.org/2000/svg'
+
+
+def _svg_with_payload(size: int) -> bytes:
+    payload = b'A' * size
+    return (
+        b'<svg xmlns="' + SVG_NS.encode() + b'" width="1" height="1" viewBox="0 0 1 1">'
+        b'<metadata data-filename="big.bin" data-content="' + payload + b'"/>'
+        b'</svg>'
+    )
+
+
+def test_large_embedded_payload_is_accepted():
+    svg = _svg_with_payload(11 * 1024 * 1024)
+
+    assert SVGValidator(svg).validate()['is_valid']
+    assert SVGValidator(svg, stream=True).validate()['is_valid']
+    assert SVGValidator.is_valid_svg(svg)